@@ -8,10 +8,12 @@ __url__ = "https://github.com/Dennis-van-Gils/DvG_Arduino_PyQt_multithread_demo"
 __date__ = "11-06-2024"
 __version__ = "9.0"
 
+import math
 import time
+import struct
 import datetime
 
-import numpy as np
+import serial
 
 from dvg_debug_functions import dprint, print_fancy_traceback as pft
 from dvg_devices.Arduino_protocol_serial import Arduino
@@ -29,13 +31,18 @@ class WaveGeneratorArduino(Arduino):
         """Container for the process and measurement variables of the wave
         generator Arduino."""
 
-        time_0 = np.nan
+        time_0 = math.nan
         """[s] Time at start of data acquisition"""
-        time = np.nan
+        time = math.nan
         """[s] Time at reading_1"""
-        reading_1 = np.nan
+        reading_1 = math.nan
         """[arbitrary units]"""
 
+    BINARY_SYNC_BYTE = 0xA5
+    """First byte of the binary reply to query "b?", see `perform_DAQ()`"""
+    BINARY_REPLY = struct.Struct("<BIfB")
+    """Layout of the binary reply to query "b?", see `perform_DAQ()`"""
+
     def __init__(
         self,
         name="Ard",
@@ -51,23 +58,83 @@ class WaveGeneratorArduino(Arduino):
         # Container for the process and measurement variables
         self.state = self.State
 
-        """Remember, you might need a mutex for proper multithreading. If the
-        state variables are not atomic or thread-safe, you should lock and
-        unlock this mutex for each read and write operation. In this demo we
-        don't need it, hence it's commented out but I keep it as a reminder."""
-        # self.mutex = QtCore.QMutex()
+        # Does the firmware understand the binary query "b?"? Probed in
+        # `connect_at_port()`.
+        self.binary_DAQ = False
+
+        """No mutex of our own is needed here. `QDeviceIO` creates `dev.mutex`
+        when it is missing and holds it during every DAQ update and every job,
+        so the serial port is never accessed by two threads at once. The
+        `state` variables are written only by the DAQ thread and only read by
+        the GUI thread. Each one is a single float assignment, which is atomic
+        under the GIL, so readers never see a half-written value. They might
+        see a new `time` next to the previous `reading_1`, which is fine for
+        display. Should `state` ever need to be read as one consistent set,
+        lock `dev.mutex` for those reads as well."""
+
+    def connect_at_port(self, port: str, verbose: bool = True) -> bool:
+        """Open the port like `Arduino.connect_at_port()` does and, once
+        connected, request low-latency mode from the serial driver.
+
+        USB-serial converters like the FTDI chips hold back incoming bytes for
+        up to 16 ms by default before passing them on, which is longer than
+        our DAQ interval. Low-latency mode lowers this to ~1 ms. It is only
+        available on Linux and requires the driver to support it. When it is
+        not available we carry on with the default latency.
+        """
+        success = super().connect_at_port(port, verbose)
+        if success:
+            try:
+                self.ser.set_low_latency_mode(True)
+            except (AttributeError, NotImplementedError, ValueError, OSError):
+                pass
+
+            # Firmware older than the binary query "b?" ignores it, in which
+            # case the probe times out once and we fall back to the ASCII
+            # query "?" for the rest of the session
+            try:
+                success, reply = self.query_bytes(
+                    b"b?",
+                    N_bytes_to_read=self.BINARY_REPLY.size,
+                    raises_on_timeout=True,
+                )
+            except serial.SerialException:
+                success = False
+
+            self.binary_DAQ = success and self._is_valid_binary_reply(reply)
+            if not self.binary_DAQ:
+                self.ser.reset_input_buffer()
+                if verbose:
+                    print("  Binary query 'b?' not supported, using ASCII.")
+
+        return success
 
     def set_waveform_to_sine(self):
         """Send the instruction to the Arduino to change to a sine wave."""
-        self.write("sine")
+        self.write(b"sine")
 
     def set_waveform_to_square(self):
         """Send the instruction to the Arduino to change to a square wave."""
-        self.write("square")
+        self.write(b"square")
 
     def set_waveform_to_sawtooth(self):
         """Send the instruction to the Arduino to change to a sawtooth wave."""
-        self.write("sawtooth")
+        self.write(b"sawtooth")
+
+    def _is_valid_binary_reply(self, reply: bytes) -> bool:
+        """Check the binary reply to query "b?". It is a fixed-size frame,
+        little-endian: [uint8 sync byte, uint32 time in ms, float32
+        reading_1, uint8 checksum]. The checksum is the XOR of the 8 bytes
+        in between.
+        """
+        if reply[0] != self.BINARY_SYNC_BYTE:
+            return False
+
+        checksum = 0
+        for byte in reply[1:-1]:
+            checksum ^= byte
+
+        return checksum == reply[-1]
 
     def perform_DAQ(self) -> bool:
         """Query the Arduino for new readings, parse them and update the
@@ -78,6 +145,49 @@ class WaveGeneratorArduino(Arduino):
         # We will catch any exceptions and report on them, but will deliberately
         # not reraise them. Design choice: The show must go on regardless.
 
+        if not self.binary_DAQ:
+            return self._perform_ASCII_DAQ()
+
+        # Query the Arduino for its state. The binary frame saves the Arduino
+        # from formatting the floats into ASCII and saves us from tokenizing
+        # and parsing them back again. When out of sync with the Arduino, we
+        # discard any stale bytes and try once more.
+        for _ in range(2):
+            success, reply = self.query_bytes(
+                b"b?", N_bytes_to_read=self.BINARY_REPLY.size
+            )
+            if not success:
+                # The read might have timed out mid-frame. Discard the partial
+                # frame, so that its tail can't misalign the next query.
+                self.ser.reset_input_buffer()
+                dprint(
+                    f"'{self.name}' reports IOError @ "
+                    f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                )
+                return False
+
+            if self._is_valid_binary_reply(reply):
+                break
+
+            self.ser.reset_input_buffer()
+        else:
+            dprint(
+                f"'{self.name}' reports out-of-sync reply @ "
+                f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            )
+            return False
+
+        # Parse readings into separate state variables
+        _, time_ms, reading_1, _ = self.BINARY_REPLY.unpack(reply)
+        self.state.time = time_ms / 1000  # Transform [ms] to [s]
+        self.state.reading_1 = reading_1
+
+        return True
+
+    def _perform_ASCII_DAQ(self) -> bool:
+        """Like `perform_DAQ()`, but via the ASCII query "?" for firmware that
+        does not understand the binary query "b?".
+        """
         # Query the Arduino for its state
         success, reply = self.query_ascii_values("?", delimiter="\t")
         if not success:
@@ -119,9 +229,9 @@ class FakeWaveGeneratorArduino:
         """Container for the process and measurement variables of the wave
         generator Arduino."""
 
-        time_0 = np.nan  # [s] Start of data acquisition
-        time = np.nan  # [s]
-        reading_1 = np.nan  # [arbitrary units]
+        time_0 = math.nan  # [s] Start of data acquisition
+        time = math.nan  # [s]
+        reading_1 = math.nan  # [arbitrary units]
 
     def __init__(self):
         self.serial_settings = {}
@@ -156,11 +266,11 @@ class FakeWaveGeneratorArduino:
         t = time.perf_counter()
 
         if self.wave_type == "sine":
-            value = np.sin(2 * np.pi * self.wave_freq * t)
+            value = math.sin(2 * math.pi * self.wave_freq * t)
         elif self.wave_type == "square":
-            value = 1 if np.mod(self.wave_freq * t, 1.0) > 0.5 else -1
+            value = 1 if (self.wave_freq * t) % 1.0 > 0.5 else -1
         elif self.wave_type == "sawtooth":
-            value = 2 * np.mod(self.wave_freq * t, 1.0) - 1
+            value = 2 * ((self.wave_freq * t) % 1.0) - 1
 
         self.state.time = t * 1000
         self.state.reading_1 = value
@@ -1,6 +1,6 @@
 /*******************************************************************************
   Dennis van Gils
-  14-09-2022
+  16-10-2026
  ******************************************************************************/
 
 #include <Arduino.h>
@@ -19,6 +19,11 @@ const uint8_t CMD_BUF_LEN = 16;  // Length of the ASCII command buffer
 char cmd_buf[CMD_BUF_LEN]{'\0'}; // The ASCII command buffer
 DvG_StreamCommand sc(Ser, cmd_buf, CMD_BUF_LEN);
 
+// Binary reply to the "b?" query: This sync byte followed by the
+// little-endian `uint32_t` millis timestamp and `float` wave value, closed by
+// a checksum byte that is the XOR of these 8 bytes (10 bytes in total)
+const uint8_t BINARY_SYNC_BYTE = 0xA5;
+
 /*------------------------------------------------------------------------------
     Setup
 ------------------------------------------------------------------------------*/
@@ -76,6 +81,18 @@ void loop() {
       Ser.print(curMillis);
       Ser.print('\t');
       Ser.println(wave, 4);
+
+    } else if (strcmp(str_cmd, "b?") == 0) {
+      uint8_t frame[10];
+      float wave_f = (float)wave;
+      frame[0] = BINARY_SYNC_BYTE;
+      memcpy(&frame[1], &curMillis, 4);
+      memcpy(&frame[5], &wave_f, 4);
+      frame[9] = 0;
+      for (uint8_t i = 1; i < 9; i++) {
+        frame[9] ^= frame[i];
+      }
+      Ser.write(frame, 10);
     }
   }
 }
@@ -33,10 +33,13 @@ from WaveGeneratorArduino_qdev import WaveGeneratorArduino_qdev
 # Constants
 DAQ_INTERVAL_MS = 10
 """[ms] Update interval for the data acquisition (DAQ)"""
-CHART_INTERVAL_MS = 20
+CHART_INTERVAL_MS = 33
 """[ms] Update interval for the chart"""
 CHART_HISTORY_TIME = 10
 """[s] History length of the chart"""
+DAQ_CPU_CORES = None
+"""CPU core(s) to pin the DAQ thread to, e.g. `{2}`, to keep it from migrating
+between cores. Linux only. Leave `None` to let the operating system decide."""
 
 # Global flags
 TRY_USING_OPENGL = True
@@ -94,18 +97,33 @@ class MainWindow(QtWid.QWidget):
         super().__init__(parent, **kwargs)
 
         self.qdev = qdev
-        self.qdev.signal_DAQ_updated.connect(self.update_GUI)
         self.qlog = qlog
 
         # Run/pause mechanism on updating the GUI and graphs
         self.allow_GUI_update_of_readings = True
 
+        # Raised by `DAQ_function()` on every DAQ update and lowered again by
+        # the chart refresh timer, coalescing the fast DAQ rate into the slower
+        # GUI refresh rate. It is set directly from within the DAQ thread
+        # instead of via the `signal_DAQ_updated` signal, which would post a
+        # queued event to the GUI thread on every single DAQ update. A plain
+        # bool assignment is atomic, so no mutex is needed.
+        self.DAQ_has_updated = False
+
+        # Last values shown in the GUI. Used to skip redundant `setText()`
+        # calls, as each one invalidates the widget and schedules a repaint.
+        self._last_dt_sec = 0
+        self._last_DAQ_rate = None
+        self._last_rec_str = None
+        self._last_t = None
+        self._last_r = None
+
         self.setWindowTitle("Arduino & PyQt multithread demo")
         if USE_LARGER_TEXT:
             self.setGeometry(40, 60, 1024, 768)
         else:
             self.setGeometry(40, 60, 960, 660)
-        self.setStyleSheet(controls.SS_TEXTBOX_READ_ONLY + controls.SS_GROUP)
+        self.setStyleSheet(controls.SS_GROUP)
 
         # -------------------------
         #   Chart refresh timer
@@ -234,9 +252,31 @@ class MainWindow(QtWid.QWidget):
         )
 
         # 'Readings'
-        p = {"readOnly": True, "maximumWidth": 112 if USE_LARGER_TEXT else 63}
-        self.qlin_reading_t = QtWid.QLineEdit(**p)
-        self.qlin_reading_1 = QtWid.QLineEdit(**p)
+        # Display-only, so use plain-text `QLabel`s styled as read-only text
+        # boxes. A `QLineEdit` would also maintain a cursor, a selection and an
+        # undo stack on every `setText()`.
+        font_mono = QtGui.QFontDatabase.systemFont(
+            QtGui.QFontDatabase.SystemFont.FixedFont
+        )
+        font_mono.setPointSize(QtWid.QApplication.font().pointSize())
+        self.qlbl_reading_t = QtWid.QLabel()
+        self.qlbl_reading_1 = QtWid.QLabel()
+        for qlbl in (self.qlbl_reading_t, self.qlbl_reading_1):
+            qlbl.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            qlbl.setFont(font_mono)
+            qlbl.setAlignment(
+                QtCore.Qt.AlignmentFlag.AlignRight
+                | QtCore.Qt.AlignmentFlag.AlignVCenter
+            )
+            # Look like a read-only `QLineEdit`
+            qlbl.setStyleSheet(
+                "QLabel {"
+                "padding: 0 2px;"
+                "border: 1px solid gray;"
+                "background: " + controls.COLOR_READ_ONLY + ";}"
+                "QLabel:hover {"
+                "border: 1px solid " + controls.COLOR_HOVER_BORDER + ";}"
+            )
         self.qpbt_running = controls.create_Toggle_button(
             "Running", checked=True
         )
@@ -248,9 +288,9 @@ class MainWindow(QtWid.QWidget):
         grid = QtWid.QGridLayout()
         grid.addWidget(self.qpbt_running   , 0, 0, 1, 2)
         grid.addWidget(QtWid.QLabel("time"), 1, 0)
-        grid.addWidget(self.qlin_reading_t , 1, 1)
+        grid.addWidget(self.qlbl_reading_t , 1, 1)
         grid.addWidget(QtWid.QLabel("#01") , 2, 0)
-        grid.addWidget(self.qlin_reading_1 , 2, 1)
+        grid.addWidget(self.qlbl_reading_1 , 2, 1)
         grid.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
         # fmt: on
 
@@ -340,6 +380,21 @@ class MainWindow(QtWid.QWidget):
         vbox.addSpacerItem(QtWid.QSpacerItem(0, 10))
         vbox.addLayout(hbox_bot, stretch=1)
 
+        # Pin the labels that get updated at the GUI refresh rate to the size
+        # of their widest expected text. Qt only skips invalidating the parent
+        # layout on `setText()` when a widget has a fixed width and height.
+        for qlbl, widest_text in (
+            (self.qlbl_update_counter, "000000000"),
+            (self.qlbl_DAQ_rate, "DAQ: 000.0 Hz"),
+            (self.qlbl_reading_t, "00000.000"),
+            (self.qlbl_reading_1, "00000.000"),
+        ):
+            text = qlbl.text()
+            qlbl.setText(widest_text)
+            qlbl.ensurePolished()
+            qlbl.setFixedSize(qlbl.sizeHint().expandedTo(qlbl.minimumSize()))
+            qlbl.setText(text)
+
     # --------------------------------------------------------------------------
     #   Handle controls
     # --------------------------------------------------------------------------
@@ -353,27 +408,51 @@ class MainWindow(QtWid.QWidget):
     def update_GUI(self):
         state = self.qdev.dev.state  # Shorthand
 
-        self.qlbl_cur_date_time.setText(
-            f"{datetime.datetime.now().strftime('%d-%m-%Y    %H:%M:%S')}"
-        )
+        # The date-time label has a resolution of 1 second, so only format it
+        # when the wall-clock second rolls over
+        dt_sec = int(time.time())
+        if dt_sec != self._last_dt_sec:
+            self._last_dt_sec = dt_sec
+            self.qlbl_cur_date_time.setText(
+                time.strftime("%d-%m-%Y    %H:%M:%S", time.localtime(dt_sec))
+            )
+
         self.qlbl_update_counter.setText(f"{self.qdev.update_counter_DAQ}")
-        self.qlbl_DAQ_rate.setText(
-            f"DAQ: {self.qdev.obtained_DAQ_rate_Hz:.1f} Hz"
-        )
-        self.qlbl_recording_time.setText(
+
+        if self.qdev.obtained_DAQ_rate_Hz != self._last_DAQ_rate:
+            self._last_DAQ_rate = self.qdev.obtained_DAQ_rate_Hz
+            self.qlbl_DAQ_rate.setText(
+                f"DAQ: {self.qdev.obtained_DAQ_rate_Hz:.1f} Hz"
+            )
+
+        rec_str = (
             f"REC: {self.qlog.pretty_elapsed()}"
             if self.qlog.is_recording()
             else ""
         )
+        if rec_str != self._last_rec_str:
+            self._last_rec_str = rec_str
+            self.qlbl_recording_time.setText(rec_str)
 
         if not self.allow_GUI_update_of_readings:
             return
 
-        self.qlin_reading_t.setText(f"{state.time:.3f}")
-        self.qlin_reading_1.setText(f"{state.reading_1:.4f}")
+        if state.time != self._last_t:
+            self._last_t = state.time
+            self.qlbl_reading_t.setText(f"{state.time:.3f}")
+        if state.reading_1 != self._last_r:
+            self._last_r = state.reading_1
+            self.qlbl_reading_1.setText(f"{state.reading_1:.4f}")
 
     @Slot()
     def update_chart(self):
+        # Only refresh when new data got acquired since the previous refresh
+        if not self.DAQ_has_updated:
+            return
+
+        self.DAQ_has_updated = False
+        self.update_GUI()
+
         if not self.allow_GUI_update_of_readings:
             return
 
@@ -438,6 +517,13 @@ if __name__ == "__main__":
 
         Returns: True if successful, False otherwise.
         """
+        # Pin the DAQ thread to the requested CPU core(s), once
+        if DAQ_CPU_CORES is not None and ard_qdev.update_counter_DAQ == 1:
+            try:
+                os.sched_setaffinity(0, DAQ_CPU_CORES)  # 0: The calling thread
+            except (AttributeError, OSError, ValueError):
+                print("Warning: Could not pin the DAQ thread to a CPU core.\n")
+
         # Query the Arduino for new readings, parse them and update the
         # corresponding variables of its `state` member.
         if not ard.perform_DAQ():
@@ -459,6 +545,9 @@ if __name__ == "__main__":
         # Create and add readings to the log
         log.update()
 
+        # Flag the GUI to refresh on its next chart timer tick
+        window.DAQ_has_updated = True
+
         return True
 
     ard_qdev = WaveGeneratorArduino_qdev(
@@ -501,7 +590,6 @@ if __name__ == "__main__":
     # --------------------------------------------------------------------------
 
     def stop_running():
-        app.processEvents()
         log.close()
         ard_qdev.quit()
         ard.close()
@@ -29,7 +29,7 @@ from WaveGeneratorArduino_qdev import WaveGeneratorArduino_qdev
 # Constants
 DAQ_INTERVAL_MS = 10
 """[ms] Update interval for the data acquisition (DAQ)"""
-CHART_INTERVAL_MS = 20
+CHART_INTERVAL_MS = 33
 """[ms] Update interval for the chart"""
 CHART_HISTORY_TIME = 10
 """[s] History length of the chart"""
@@ -201,7 +201,6 @@ if __name__ == "__main__":
     @Slot()
     def about_to_quit():
         print("\nAbout to quit")
-        app.processEvents()
         ard_qdev.quit()
         ard.close()
 
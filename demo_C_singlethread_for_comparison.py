@@ -18,9 +18,9 @@ __version__ = "9.0"
 # pylint: disable=global-statement
 
 import os
+import math
 import sys
 import time
-import datetime
 from typing import Union
 
 import qtpy
@@ -28,7 +28,6 @@ from qtpy import QtCore, QtGui, QtWidgets as QtWid
 from qtpy.QtCore import Slot  # type: ignore
 
 import psutil
-import numpy as np
 import pyqtgraph as pg
 
 from dvg_debug_functions import tprint
@@ -41,7 +40,7 @@ from WaveGeneratorArduino import WaveGeneratorArduino, FakeWaveGeneratorArduino
 # Constants
 DAQ_INTERVAL_MS = 10
 """[ms] Update interval for the data acquisition (DAQ)"""
-CHART_INTERVAL_MS = 20
+CHART_INTERVAL_MS = 33
 """[ms] Update interval for the chart"""
 CHART_HISTORY_TIME = 10
 """[s] History length of the chart"""
@@ -85,16 +84,47 @@ else:
 pg.setConfigOption("foreground", "#EEE")
 
 # ------------------------------------------------------------------------------
-#   Globals for keeping track of the obtained DAQ rate in singlethreaded mode
+#   DAQRateTracker
 # ------------------------------------------------------------------------------
 
-# The obtained DAQ rate is normally being tracked via the multithreaded
-# `QDeviceIO` instance, but because we are demoing singlethreaded performance we
-# use these globals instead.
-update_counter_DAQ = 0
-obtained_DAQ_rate_Hz = np.nan
-QET_rate = QtCore.QElapsedTimer()
-rate_accumulator = 0
+
+class DAQRateTracker:
+    """Keeps track of the obtained DAQ rate in singlethreaded mode.
+
+    The obtained DAQ rate is normally being tracked via the multithreaded
+    `QDeviceIO` instance, but because we are demoing singlethreaded performance
+    we use this stand-in instead. It mimics the attribute names of `QDeviceIO`.
+    """
+
+    __slots__ = (
+        "update_counter_DAQ",
+        "obtained_DAQ_rate_Hz",
+        "_QET_rate",
+        "_rate_accumulator",
+    )
+
+    def __init__(self):
+        self.update_counter_DAQ = 0
+        self.obtained_DAQ_rate_Hz = math.nan
+        self._QET_rate = QtCore.QElapsedTimer()
+        self._rate_accumulator = 0
+
+    def tick(self):
+        """To be called once per DAQ update."""
+        self.update_counter_DAQ += 1
+
+        if not self._QET_rate.isValid():
+            self._QET_rate.start()
+        else:
+            # Obtained DAQ rate
+            self._rate_accumulator += 1
+            dT = self._QET_rate.elapsed()
+
+            if dT >= 1000:  # Evaluate every N elapsed milliseconds. Hard-coded.
+                self._QET_rate.restart()
+                self.obtained_DAQ_rate_Hz = self._rate_accumulator / dT * 1e3
+                self._rate_accumulator = 0
+
 
 # ------------------------------------------------------------------------------
 #   MainWindow
@@ -106,6 +136,7 @@ class MainWindow(QtWid.QWidget):
         self,
         dev: Union[WaveGeneratorArduino, FakeWaveGeneratorArduino],
         qlog: FileLogger,
+        daq_rate_tracker: DAQRateTracker,
         parent=None,
         **kwargs,
     ):
@@ -113,13 +144,27 @@ class MainWindow(QtWid.QWidget):
 
         self.dev = dev
         self.qlog = qlog
+        self.daq_rate_tracker = daq_rate_tracker
 
         # Run/pause mechanism on updating the GUI and graphs
         self.allow_GUI_update_of_readings = True
 
+        # Raised by `DAQ_function()` on every DAQ update and lowered again by
+        # the chart refresh timer, coalescing the fast DAQ rate into the slower
+        # GUI refresh rate
+        self.DAQ_has_updated = False
+
+        # Last values shown in the GUI. Used to skip redundant `setText()`
+        # calls, as each one invalidates the widget and schedules a repaint.
+        self._last_dt_sec = 0
+        self._last_DAQ_rate = None
+        self._last_rec_str = None
+        self._last_t = None
+        self._last_r = None
+
         self.setWindowTitle("Arduino & PyQt singlethread demo")
         self.setGeometry(40, 60, 960, 660)
-        self.setStyleSheet(controls.SS_TEXTBOX_READ_ONLY + controls.SS_GROUP)
+        self.setStyleSheet(controls.SS_GROUP)
 
         # -------------------------
         #   Chart refresh timer
@@ -231,9 +276,31 @@ class MainWindow(QtWid.QWidget):
         )
 
         # 'Readings'
-        p = {"readOnly": True, "maximumWidth": 63}
-        self.qlin_reading_t = QtWid.QLineEdit(**p)
-        self.qlin_reading_1 = QtWid.QLineEdit(**p)
+        # Display-only, so use plain-text `QLabel`s styled as read-only text
+        # boxes. A `QLineEdit` would also maintain a cursor, a selection and an
+        # undo stack on every `setText()`.
+        font_mono = QtGui.QFontDatabase.systemFont(
+            QtGui.QFontDatabase.SystemFont.FixedFont
+        )
+        font_mono.setPointSize(QtWid.QApplication.font().pointSize())
+        self.qlbl_reading_t = QtWid.QLabel()
+        self.qlbl_reading_1 = QtWid.QLabel()
+        for qlbl in (self.qlbl_reading_t, self.qlbl_reading_1):
+            qlbl.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+            qlbl.setFont(font_mono)
+            qlbl.setAlignment(
+                QtCore.Qt.AlignmentFlag.AlignRight
+                | QtCore.Qt.AlignmentFlag.AlignVCenter
+            )
+            # Look like a read-only `QLineEdit`
+            qlbl.setStyleSheet(
+                "QLabel {"
+                "padding: 0 2px;"
+                "border: 1px solid gray;"
+                "background: " + controls.COLOR_READ_ONLY + ";}"
+                "QLabel:hover {"
+                "border: 1px solid " + controls.COLOR_HOVER_BORDER + ";}"
+            )
         self.qpbt_running = controls.create_Toggle_button(
             "Running", checked=True
         )
@@ -245,9 +312,9 @@ class MainWindow(QtWid.QWidget):
         grid = QtWid.QGridLayout()
         grid.addWidget(self.qpbt_running   , 0, 0, 1, 2)
         grid.addWidget(QtWid.QLabel("time"), 1, 0)
-        grid.addWidget(self.qlin_reading_t , 1, 1)
+        grid.addWidget(self.qlbl_reading_t , 1, 1)
         grid.addWidget(QtWid.QLabel("#01") , 2, 0)
-        grid.addWidget(self.qlin_reading_1 , 2, 1)
+        grid.addWidget(self.qlbl_reading_1 , 2, 1)
         grid.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
         # fmt: on
 
@@ -333,6 +400,21 @@ class MainWindow(QtWid.QWidget):
         vbox.addSpacerItem(QtWid.QSpacerItem(0, 10))
         vbox.addLayout(hbox_bot, stretch=1)
 
+        # Pin the labels that get updated at the GUI refresh rate to the size
+        # of their widest expected text. Qt only skips invalidating the parent
+        # layout on `setText()` when a widget has a fixed width and height.
+        for qlbl, widest_text in (
+            (self.qlbl_update_counter, "000000000"),
+            (self.qlbl_DAQ_rate, "DAQ: 000.0 Hz"),
+            (self.qlbl_reading_t, "00000.000"),
+            (self.qlbl_reading_1, "00000.000"),
+        ):
+            text = qlbl.text()
+            qlbl.setText(widest_text)
+            qlbl.ensurePolished()
+            qlbl.setFixedSize(qlbl.sizeHint().expandedTo(qlbl.minimumSize()))
+            qlbl.setText(text)
+
     # --------------------------------------------------------------------------
     #   Handle controls
     # --------------------------------------------------------------------------
@@ -346,25 +428,50 @@ class MainWindow(QtWid.QWidget):
     def update_GUI(self):
         state = self.dev.state  # Shorthand
 
-        self.qlbl_cur_date_time.setText(
-            f"{datetime.datetime.now().strftime('%d-%m-%Y    %H:%M:%S')}"
-        )
-        self.qlbl_update_counter.setText(f"{update_counter_DAQ}")
-        self.qlbl_DAQ_rate.setText(f"DAQ: {obtained_DAQ_rate_Hz:.1f} Hz")
-        self.qlbl_recording_time.setText(
+        # The date-time label has a resolution of 1 second, so only format it
+        # when the wall-clock second rolls over
+        dt_sec = int(time.time())
+        if dt_sec != self._last_dt_sec:
+            self._last_dt_sec = dt_sec
+            self.qlbl_cur_date_time.setText(
+                time.strftime("%d-%m-%Y    %H:%M:%S", time.localtime(dt_sec))
+            )
+
+        self.qlbl_update_counter.setText(f"{self.daq_rate_tracker.update_counter_DAQ}")
+
+        DAQ_rate = self.daq_rate_tracker.obtained_DAQ_rate_Hz
+        if DAQ_rate != self._last_DAQ_rate:
+            self._last_DAQ_rate = DAQ_rate
+            self.qlbl_DAQ_rate.setText(f"DAQ: {DAQ_rate:.1f} Hz")
+
+        rec_str = (
             f"REC: {self.qlog.pretty_elapsed()}"
             if self.qlog.is_recording()
             else ""
         )
+        if rec_str != self._last_rec_str:
+            self._last_rec_str = rec_str
+            self.qlbl_recording_time.setText(rec_str)
 
         if not self.allow_GUI_update_of_readings:
             return
 
-        self.qlin_reading_t.setText(f"{state.time:.3f}")
-        self.qlin_reading_1.setText(f"{state.reading_1:.4f}")
+        if state.time != self._last_t:
+            self._last_t = state.time
+            self.qlbl_reading_t.setText(f"{state.time:.3f}")
+        if state.reading_1 != self._last_r:
+            self._last_r = state.reading_1
+            self.qlbl_reading_1.setText(f"{state.reading_1:.4f}")
 
     @Slot()
     def update_chart(self):
+        # Only refresh when new data got acquired since the previous refresh
+        if not self.DAQ_has_updated:
+            return
+
+        self.DAQ_has_updated = False
+        self.update_GUI()
+
         if not self.allow_GUI_update_of_readings:
             return
 
@@ -449,60 +556,51 @@ if __name__ == "__main__":
     #   Singlethreaded DAQ function
     # --------------------------------------------------------------------------
 
-    @Slot()
-    def DAQ_function():
-        """Perform a single data acquisition and append this data to the chart
-        and log.
+    def make_DAQ_function(dev, qlog, main_window):
+        """Return the DAQ function with its context captured in a closure. It
+        runs on every DAQ tick, where these names now resolve as fast closure
+        lookups instead of module-global dict lookups.
         """
-        # Keep track of the obtained DAQ rate
-        global update_counter_DAQ, rate_accumulator, obtained_DAQ_rate_Hz
-
-        update_counter_DAQ += 1
-
-        if not QET_rate.isValid():
-            QET_rate.start()
-        else:
-            # Obtained DAQ rate
-            rate_accumulator += 1
-            dT = QET_rate.elapsed()
-
-            if dT >= 1000:  # Evaluate every N elapsed milliseconds. Hard-coded.
-                QET_rate.restart()
-                try:
-                    obtained_DAQ_rate_Hz = rate_accumulator / dT * 1e3
-                except ZeroDivisionError:
-                    obtained_DAQ_rate_Hz = np.nan
-
-                rate_accumulator = 0
-
-        # Query the Arduino for new readings, parse them and update the
-        # corresponding variables of its `state` member.
-        if not ard.perform_DAQ():
-            sys.exit(0)
-
-        # Use Arduino time or PC time?
-        now = time.perf_counter() if USE_PC_TIME else ard.state.time
-        if update_counter_DAQ == 1:
-            ard.state.time_0 = now
-            ard.state.time = 0
-        else:
-            ard.state.time = now - ard.state.time_0
-
-        # Add readings to chart history
-        window.history_chart_curve.appendData(
-            ard.state.time, ard.state.reading_1
-        )
-
-        # Create and add readings to the log
-        log.update()
-
-        # We update the GUI right now because this is a singlethread demo
-        window.update_GUI()
-
-    timer_state = QtCore.QTimer()
-    timer_state.timeout.connect(DAQ_function)
-    timer_state.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
-    timer_state.start(DAQ_INTERVAL_MS)
+        state = dev.state
+        perform_DAQ = dev.perform_DAQ
+        tracker_tick = main_window.daq_rate_tracker.tick
+        tracker = main_window.daq_rate_tracker
+        append_to_chart = main_window.history_chart_curve.appendData
+        update_log = qlog.update
+        perf_counter = time.perf_counter
+        use_PC_time = USE_PC_TIME
+
+        @Slot()
+        def DAQ_function():
+            """Perform a single data acquisition and append this data to the
+            chart and log.
+            """
+            # Keep track of the obtained DAQ rate
+            tracker_tick()
+
+            # Query the Arduino for new readings, parse them and update the
+            # corresponding variables of its `state` member.
+            if not perform_DAQ():
+                sys.exit(0)
+
+            # Use Arduino time or PC time?
+            now = perf_counter() if use_PC_time else state.time
+            if tracker.update_counter_DAQ == 1:
+                state.time_0 = now
+                state.time = 0
+            else:
+                state.time = now - state.time_0
+
+            # Add readings to chart history
+            append_to_chart(state.time, state.reading_1)
+
+            # Create and add readings to the log
+            update_log()
+
+            # Flag the GUI to refresh on its next chart timer tick
+            main_window.DAQ_has_updated = True
+
+        return DAQ_function
 
     # --------------------------------------------------------------------------
     #   Program termination routines
@@ -511,7 +609,6 @@ if __name__ == "__main__":
     @Slot()
     def about_to_quit():
         print("\nAbout to quit")
-        app.processEvents()
         log.close()
         ard.close()
 
@@ -523,9 +620,15 @@ if __name__ == "__main__":
     #   Start the main GUI event loop
     # --------------------------------------------------------------------------
 
-    window = MainWindow(dev=ard, qlog=log)
+    window = MainWindow(dev=ard, qlog=log, daq_rate_tracker=DAQRateTracker())
     window.timer_chart.start(CHART_INTERVAL_MS)
     window.show()
 
+    DAQ_function = make_DAQ_function(ard, log, window)
+    timer_state = QtCore.QTimer()
+    timer_state.timeout.connect(DAQ_function)
+    timer_state.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+    timer_state.start(DAQ_INTERVAL_MS)
+
     app.aboutToQuit.connect(about_to_quit)
     sys.exit(app.exec())
@@ -158,7 +158,6 @@ if __name__ == "__main__":
 
     @Slot()
     def about_to_quit():
-        app.processEvents()
         print("\nAbout to quit")
         ard_qdev.quit()
         ard.close()
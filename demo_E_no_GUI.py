@@ -236,7 +236,6 @@ if __name__ == "__main__":
 
     @Slot()
     def about_to_quit():
-        app.processEvents()
         print("\nAbout to quit")
         sync_qdev.quit()
         ard_qdev.quit()